@@ -1,19 +1,28 @@
 import os
+import re
+import pickle
+import functools
 from datetime import datetime, timedelta, time as dtime
 from dateutil import tz
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import phonenumbers
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+from apscheduler.executors.pool import ThreadPoolExecutor as APSThreadPool
 
 from sqlalchemy import (
-    create_engine, Column, Integer, String, DateTime, Text, ForeignKey, func, UniqueConstraint
+    create_engine, event, inspect, select, insert, delete, text, Column, Integer, String, DateTime, Text, ForeignKey, func, UniqueConstraint, Index
 )
-from sqlalchemy.orm import declarative_base, sessionmaker, relationship, selectinload
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.orm import declarative_base, sessionmaker, relationship, selectinload, load_only
+
+import jobs
 
 # --------------------
 # Config
@@ -24,15 +33,45 @@ API_SESSION  = os.getenv("WA_API_SESSION", "default")
 DB_URL       = os.getenv("WA_DB_URL", "sqlite:///wa_task_app.sqlite")
 LOCAL_TZ     = os.getenv("WA_TZ", "Asia/Kolkata")
 HEADERS      = {"Accept": "application/json", "Content-Type": "application/json"}
+TZINFO       = tz.gettz(LOCAL_TZ)
+DT_FMT       = "%d-%b-%Y %I:%M %p"
 
 st.set_page_config(page_title="Task Assigner (WhatsApp)", page_icon="✅", layout="wide")
 
 # --------------------
 # DB
 # --------------------
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA foreign_keys=ON",
+)
+
 @st.cache_resource
 def _db():
-    engine = create_engine(DB_URL, connect_args={"check_same_thread": False})
+    connect_args = {"check_same_thread": False, "timeout": 30}
+    if DB_URL in ("sqlite://", "sqlite:///:memory:"):
+        # In-memory DB lives in a single connection; share it across threads
+        engine = create_engine(DB_URL, poolclass=StaticPool, connect_args=connect_args)
+    else:
+        engine = create_engine(
+            DB_URL, poolclass=QueuePool, pool_size=5, max_overflow=10,
+            pool_pre_ping=True, connect_args=connect_args,
+        )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cur.execute(pragma)
+        finally:
+            cur.close()
+
     SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
     return engine, SessionLocal
 
@@ -50,7 +89,10 @@ class Contact(Base):
     note = Column(String(500), default="")
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now(), server_default=func.now())
-    __table_args__ = (UniqueConstraint("chat_id", name="uq_chatid"),)
+    __table_args__ = (
+        UniqueConstraint("chat_id", name="uq_chatid"),
+        Index("ix_contact_phone_e164", "phone_e164"),
+    )
 
 class Setting(Base):
     __tablename__ = "settings"
@@ -76,24 +118,108 @@ class Task(Base):
 
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now(), server_default=func.now())
+    __table_args__ = (
+        Index("ix_task_status_created", "status", "created_at"),
+        Index("ix_task_assignee", "assignee_id"),
+    )
 
 class TaskComment(Base):
     __tablename__ = "task_comments"
     id = Column(Integer, primary_key=True)
-    task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     author = Column(String(120), default="admin")
     body = Column(Text, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
+    __table_args__ = (Index("ix_comments_task_id", "task_id"),)
 
 Base.metadata.create_all(engine)
 
+@st.cache_resource
+def _ensure_indexes() -> None:
+    # create_all skips indexes on tables that already exist; add any new ones
+    for table in Base.metadata.sorted_tables:
+        for ix in table.indexes:
+            ix.create(engine, checkfirst=True)
+
+_ensure_indexes()
+
+CONTACTS_FTS_DDL = (
+    # trigram keeps the old ILIKE '%q%' substring semantics (needs SQLite >= 3.34)
+    """CREATE VIRTUAL TABLE contacts_fts USING fts5(
+        name, phone_e164, note, tags,
+        content='contacts', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN
+        INSERT INTO contacts_fts(rowid, name, phone_e164, note, tags)
+        VALUES (new.id, new.name, new.phone_e164, new.note, new.tags);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, name, phone_e164, note, tags)
+        VALUES ('delete', old.id, old.name, old.phone_e164, old.note, old.tags);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE ON contacts BEGIN
+        INSERT INTO contacts_fts(contacts_fts, rowid, name, phone_e164, note, tags)
+        VALUES ('delete', old.id, old.name, old.phone_e164, old.note, old.tags);
+        INSERT INTO contacts_fts(rowid, name, phone_e164, note, tags)
+        VALUES (new.id, new.name, new.phone_e164, new.note, new.tags);
+    END""",
+    "INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')",
+)
+
+@st.cache_resource
+def _contacts_fts_ready() -> bool:
+    """Create the contacts FTS index once; False means fall back to ILIKE."""
+    if engine.dialect.name != "sqlite":
+        return False
+    try:
+        with engine.begin() as c:
+            exists = c.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='contacts_fts'"
+            )).first()
+            if not exists:
+                for stmt in CONTACTS_FTS_DDL:
+                    c.execute(text(stmt))
+        return True
+    except Exception:
+        return False
+
+_contacts_fts_ready()
+
 # --------------------
 # Scheduler
 # --------------------
+TASK_JOB_FUNC = "jobs:send_task_ping"  # stored as an import path, see jobs.py
+
+def _migrate_job_refs():
+    """Repoint task jobs stored as ...:_send_task_ping at TASK_JOB_FUNC.
+    Edits the pickled state directly; APScheduler would drop these rows
+    if it tried to resolve the old __main__ reference itself."""
+    if not inspect(engine).has_table("apscheduler_jobs"):
+        return
+    new_ref = TASK_JOB_FUNC.encode()
+    with engine.begin() as c:
+        rows = c.execute(text("SELECT id, job_state FROM apscheduler_jobs WHERE id LIKE 'task-%'")).all()
+        for jid, blob in rows:
+            if new_ref in blob:  # already migrated; skip unpickling
+                continue
+            state = pickle.loads(blob)
+            if not str(state.get("func", "")).endswith(":_send_task_ping"):
+                continue
+            state["func"] = TASK_JOB_FUNC
+            c.execute(
+                text("UPDATE apscheduler_jobs SET job_state = :state WHERE id = :id"),
+                {"state": pickle.dumps(state, pickle.HIGHEST_PROTOCOL), "id": jid},
+            )
+
 @st.cache_resource
 def _sched():
-    stores = {"default": SQLAlchemyJobStore(url=DB_URL)}
-    s = BackgroundScheduler(jobstores=stores, timezone=LOCAL_TZ)
+    # Must run before start(), which loads due jobs and resolves their refs
+    _migrate_job_refs()
+    # Share the pooled, WAL-tuned engine so the Jobs tab reads the same table (also for :memory:)
+    stores = {"default": SQLAlchemyJobStore(engine=engine)}
+    executors = {"default": APSThreadPool(max_workers=8)}
+    job_defaults = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 900}  # 15 minutes
+    s = BackgroundScheduler(jobstores=stores, executors=executors, job_defaults=job_defaults, timezone=LOCAL_TZ)
     s.start()
     return s
 
@@ -105,47 +231,108 @@ def job_id_for_task(task_id: int) -> str:
 # --------------------
 # Helpers
 # --------------------
-def to_e164(raw: str, region="IN") -> str | None:
-    try:
-        num = phonenumbers.parse(str(raw), region)
-        if not phonenumbers.is_valid_number(num):
+_E164_RE = re.compile(r"^\+[1-9]\d{7,14}$")
+
+@st.cache_resource
+def _e164_parser():
+    # Built once per process so the memo survives Streamlit reruns
+    known = set()  # outputs already validated by libphonenumber
+
+    @functools.lru_cache(maxsize=4096)
+    def parse(raw: str, region: str) -> str | None:
+        try:
+            num = phonenumbers.parse(raw, region)
+            if not phonenumbers.is_valid_number(num):
+                return None
+            e164 = phonenumbers.format_number(num, phonenumbers.PhoneNumberFormat.E164)
+        except Exception:
             return None
-        return phonenumbers.format_number(num, phonenumbers.PhoneNumberFormat.E164)
+        if len(known) >= 4096:
+            known.clear()
+        known.add(e164)
+        return e164
+
+    return parse, known
+
+@st.cache_resource
+def _warm_phonenumbers() -> None:
+    # libphonenumber loads region metadata lazily; pay that at startup, not on first save
+    try:
+        phonenumbers.PhoneMetadata.metadata_for_region("IN")
+        phonenumbers.parse("+911234567890", None)
     except Exception:
-        return None
+        pass
+
+_warm_phonenumbers()
+
+def to_e164(raw: str, region="IN") -> str | None:
+    parse, known = _e164_parser()
+    raw = str(raw).strip()
+    # Resubmitted E.164 that we already validated is region-independent
+    if _E164_RE.match(raw) and raw in known:
+        return raw
+    return parse(raw, region)
 
 def chat_id_from_e164(e164: str) -> str:
     digits = "".join([c for c in e164 if c.isdigit()])
     return f"{digits}@c.us"
 
+@st.cache_resource
+def _http() -> requests.Session:
+    # Keep-alive pool shared by UI and jobs. sendText isn't idempotent, so POST
+    # is only retried when WAHA can't have processed it: connect failures and
+    # 429/502/503 (Retry-After honoured). Read errors are never retried.
+    retry = Retry(
+        total=5, read=0, backoff_factor=0.5,
+        status_forcelist=[429, 502, 503],
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    sess = requests.Session()
+    sess.headers.update(HEADERS)
+    sess.mount("http://", adapter)
+    sess.mount("https://", adapter)
+    return sess
+
 def api_send_text(chat_id: str, text: str) -> dict:
     url = f"{API_BASE}{API_SEND}"
     payload = {"chatId": chat_id, "text": text, "session": API_SESSION}
-    r = requests.post(url, json=payload, headers=HEADERS, timeout=20)
+    r = _http().post(url, json=payload, timeout=20)
     r.raise_for_status()
     try:
         return r.json()
     except Exception:
         return {"ok": True, "raw": r.text}
 
+@st.cache_resource
+def _settings_cache() -> dict:
+    # Process-wide so reruns and scheduler threads see the same values
+    return {}
+
 def get_setting(key: str, default: str) -> str:
-    s = SessionLocal()
-    try:
-        row = s.query(Setting).get(key)
-        return row.value if row else default
-    finally:
-        s.close()
+    cache = _settings_cache()
+    if key in cache:
+        return cache[key]
+    # Plain connection: a single-column read doesn't need ORM session bookkeeping
+    with engine.connect() as c:
+        row = c.execute(select(Setting.value).where(Setting.key == key)).first()
+    if not row:
+        return default
+    cache[key] = row[0]
+    return row[0]
 
 def set_setting(key: str, value: str):
     s = SessionLocal()
     try:
-        row = s.query(Setting).get(key)
+        row = s.get(Setting, key)
         if row:
             row.value = value
         else:
             row = Setting(key=key, value=value)
             s.add(row)
         s.commit()
+        _settings_cache()[key] = value
     finally:
         s.close()
 
@@ -155,7 +342,7 @@ if not get_setting("message_template", ""):
 
 def render_message(task: Task, contact: Contact) -> str:
     template = get_setting("message_template", DEFAULT_TEMPLATE)
-    due_str = task.due_at.astimezone(tz.gettz(LOCAL_TZ)).strftime("%d-%b-%Y %I:%M %p") if task.due_at else "N/A"
+    due_str = task.due_at.astimezone(TZINFO).strftime(DT_FMT) if task.due_at else "N/A"
     return template.format(
         assignee_name=contact.name,
         title=task.title,
@@ -172,7 +359,7 @@ def _send_task_ping(task_id: int) -> tuple[bool, str]:
     """Shared send path for jobs and 'Remind now'. Returns (ok, info)."""
     s = SessionLocal()
     try:
-        t = s.query(Task).options(selectinload(Task.assignee)).get(task_id)
+        t = s.get(Task, task_id)
         if not t:
             return False, "Task not found"
         if t.status in ("completed", "cancelled"):
@@ -192,12 +379,13 @@ def _send_task_ping(task_id: int) -> tuple[bool, str]:
     except Exception as e:
         return False, f"{type(e).__name__}: {e}"
 
+jobs.register_sender(_send_task_ping)
+
 def schedule_task(task: Task):
     jid = job_id_for_task(task.id)
     start = task.start_at
-    tzinfo = tz.gettz(LOCAL_TZ)
     if start.tzinfo is None:
-        start = start.replace(tzinfo=tzinfo)
+        start = start.replace(tzinfo=TZINFO)
     end = start + timedelta(days=max(0, task.remind_for_days))
     # Replace existing schedule
     try:
@@ -205,23 +393,30 @@ def schedule_task(task: Task):
     except Exception:
         pass
     scheduler.add_job(
-        _send_task_ping, "interval",
+        TASK_JOB_FUNC, "interval",
         days=max(1, task.freq_days),
         start_date=start,
         end_date=end,
         args=[task.id],
         id=jid,
-        coalesce=True,
-        misfire_grace_time=900,  # 15 minutes
         replace_existing=True,
-        max_instances=1,
     )
+    _job_rows.clear()
 
 def cancel_task_schedule(task_id: int):
     try:
         scheduler.remove_job(job_id_for_task(task_id))
     except Exception:
         pass
+    _job_rows.clear()
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _job_rows() -> list[tuple[str, float | None]]:
+    """(id, next_run_time epoch) straight from the job store, without unpickling jobs."""
+    with engine.connect() as c:
+        return [tuple(r) for r in c.execute(text(
+            "SELECT id, next_run_time FROM apscheduler_jobs ORDER BY next_run_time IS NULL, next_run_time ASC"
+        )).all()]
 
 # --------------------
 # CRUD ops
@@ -243,16 +438,27 @@ def upsert_contact(name: str, phone: str, tags: str = "", note: str = "", region
         else:
             c = Contact(name=name, phone_raw=phone, phone_e164=e164, chat_id=chat_id, tags=tags or "", note=note or "")
             s.add(c)
-        s.commit(); s.refresh(c); return c
+        s.commit(); s.refresh(c)
+        _cached_contacts_lite.clear()
+        return c
     finally:
         s.close()
 
 def list_contacts(search="", tag_contains="") -> list[Contact]:
     s = SessionLocal()
     try:
-        q = s.query(Contact)
-        if search:
-            like = f"%{search.strip()}%"
+        q = s.query(Contact).options(load_only(
+            Contact.id, Contact.name, Contact.phone_e164, Contact.chat_id, Contact.tags, Contact.note
+        ))
+        search = search.strip()
+        if search and len(search) >= 3 and _contacts_fts_ready():
+            # Whole input as one phrase, limited to the columns the UI promises
+            match = '{name phone_e164 note} : "' + search.replace('"', '""') + '"'
+            hits = text("SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH :match")
+            q = q.filter(Contact.id.in_(hits.bindparams(match=match).columns(rowid=Integer)))
+        elif search:
+            # trigram needs at least 3 characters
+            like = f"%{search}%"
             q = q.filter((Contact.name.ilike(like)) | (Contact.phone_e164.ilike(like)) | (Contact.note.ilike(like)))
         if tag_contains:
             like = f"%{tag_contains.strip()}%"
@@ -261,12 +467,16 @@ def list_contacts(search="", tag_contains="") -> list[Contact]:
     finally:
         s.close()
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_contacts_lite() -> list[tuple[int, str, str]]:
+    """(id, name, phone_e164) for dropdowns; cleared by upsert_contact."""
+    return [(c.id, c.name, c.phone_e164) for c in list_contacts()]
+
 def create_task(title, description, assignee_id, priority, due_date, start_date, start_time, freq_days, remind_for_days):
-    tzinfo = tz.gettz(LOCAL_TZ)
-    start_dt = datetime.combine(start_date, start_time).replace(tzinfo=tzinfo)
+    start_dt = datetime.combine(start_date, start_time).replace(tzinfo=TZINFO)
     due_dt = None
     if due_date:
-        due_dt = datetime.combine(due_date, dtime(18, 0)).replace(tzinfo=tzinfo)  # default 6pm if only date
+        due_dt = datetime.combine(due_date, dtime(18, 0)).replace(tzinfo=TZINFO)  # default 6pm if only date
     s = SessionLocal()
     try:
         t = Task(
@@ -276,6 +486,7 @@ def create_task(title, description, assignee_id, priority, due_date, start_date,
             status="open"
         )
         s.add(t); s.commit(); s.refresh(t)
+        task_status_counts.clear()
         schedule_task(t)
         return t
     finally:
@@ -284,11 +495,12 @@ def create_task(title, description, assignee_id, priority, due_date, start_date,
 def update_task_status(task_id: int, new_status: str):
     s = SessionLocal()
     try:
-        t = s.query(Task).get(task_id)
+        t = s.get(Task, task_id)
         if not t: return False
         t.status = new_status
-        s.add(TaskComment(task_id=task_id, author="system", body=f"Status changed to {new_status}"))
+        s.execute(insert(TaskComment).values(task_id=task_id, author="system", body=f"Status changed to {new_status}"))
         s.commit()
+        task_status_counts.clear()
         if new_status in ("completed", "cancelled"):
             cancel_task_schedule(task_id)
         else:
@@ -302,20 +514,19 @@ def delete_task(task_id: int) -> bool:
     cancel_task_schedule(task_id)
     s = SessionLocal()
     try:
-        t = s.query(Task).get(task_id)
-        if not t:
-            return False
-        s.query(TaskComment).filter_by(task_id=task_id).delete()
-        s.delete(t)
+        # Explicit comment delete covers DBs created before ON DELETE CASCADE
+        s.execute(delete(TaskComment).where(TaskComment.task_id == task_id))
+        res = s.execute(delete(Task).where(Task.id == task_id))
         s.commit()
-        return True
+        task_status_counts.clear()
+        return res.rowcount > 0
     finally:
         s.close()
 
 def add_comment(task_id: int, author: str, body: str):
     s = SessionLocal()
     try:
-        s.add(TaskComment(task_id=task_id, author=author or "admin", body=body.strip()))
+        s.execute(insert(TaskComment).values(task_id=task_id, author=author or "admin", body=body.strip()))
         s.commit()
     finally:
         s.close()
@@ -325,10 +536,22 @@ def send_now(task_id: int):
     ok, info = _send_task_ping(task_id)
     return ok, info
 
+@st.cache_data(ttl=10, show_spinner=False)
+def task_status_counts() -> dict[str, int]:
+    """Tasks per status in one GROUP BY, for the board's filter labels."""
+    with engine.connect() as c:
+        return dict(c.execute(select(Task.status, func.count()).group_by(Task.status)).all())
+
 def list_tasks(status=None, assignee_id=None, search=""):
     s = SessionLocal()
     try:
-        q = s.query(Task).options(selectinload(Task.assignee)).order_by(Task.created_at.desc())
+        # Comment counts come from the same query, limited to the filtered tasks
+        q = (
+            s.query(Task, func.count(TaskComment.id))
+             .outerjoin(TaskComment, TaskComment.task_id == Task.id)
+             .options(selectinload(Task.assignee))
+             .group_by(Task.id)
+        )
         if status and status != "all":
             q = q.filter(Task.status == status)
         if assignee_id:
@@ -336,24 +559,22 @@ def list_tasks(status=None, assignee_id=None, search=""):
         if search:
             like = f"%{search.strip()}%"
             q = q.filter((Task.title.ilike(like)) | (Task.description.ilike(like)))
-        tasks = q.all()
-        # attach numbers of comments while session is open
-        counts = dict(
-            s.query(TaskComment.task_id, func.count(TaskComment.id))
-             .group_by(TaskComment.task_id).all()
-        )
-        for t in tasks:
-            t.comments_count = counts.get(t.id, 0)
+        tasks = []
+        for t, cnt in q.order_by(Task.created_at.desc()).all():
+            t.comments_count = cnt
+            tasks.append(t)
         return tasks
     finally:
         s.close()
 
 def get_comments(task_id: int):
-    s = SessionLocal()
-    try:
-        return s.query(TaskComment).filter_by(task_id=task_id).order_by(TaskComment.created_at.asc()).all()
-    finally:
-        s.close()
+    """Rows expose .author, .body and .created_at like the ORM objects did."""
+    with engine.connect() as c:
+        return c.execute(
+            select(TaskComment.author, TaskComment.body, TaskComment.created_at)
+            .where(TaskComment.task_id == task_id)
+            .order_by(TaskComment.created_at.asc())
+        ).all()
 
 # --------------------
 # UI
@@ -385,10 +606,11 @@ with tabs[2]:
         st.rerun()
     rows = list_contacts(q, tf)
     if rows:
-        df = pd.DataFrame([{
-            "ID": r.id, "Name": r.name, "E.164": r.phone_e164, "chatId": r.chat_id,
-            "Tags": r.tags, "Note": r.note
-        } for r in rows])
+        df = pd.DataFrame({
+            "ID": [r.id for r in rows], "Name": [r.name for r in rows],
+            "E.164": [r.phone_e164 for r in rows], "chatId": [r.chat_id for r in rows],
+            "Tags": [r.tags for r in rows], "Note": [r.note for r in rows],
+        })
         st.dataframe(df, use_container_width=True, hide_index=True)
     else:
         st.info("No contacts yet.")
@@ -396,7 +618,7 @@ with tabs[2]:
 # Create Task
 with tabs[1]:
     st.header("Create Task")
-    people = list_contacts()
+    people = _cached_contacts_lite()
     if not people:
         st.warning("Add contacts first.")
     else:
@@ -408,7 +630,7 @@ with tabs[1]:
             description = st.text_area("Description", height=100)
 
             c1, c2, c3 = st.columns([2,2,2])
-            assignee_label_to_id = {f"{p.name} ({p.phone_e164})": p.id for p in people}
+            assignee_label_to_id = {f"{name} ({e164})": cid for cid, name, e164 in people}
             assignee_label = c1.selectbox("Assignee", list(assignee_label_to_id.keys()))
             due_date = c2.date_input("Due date (optional)", value=None)
             freq_days = c3.selectbox(
@@ -419,7 +641,10 @@ with tabs[1]:
             )
 
             d1, d2, d3 = st.columns([2,2,2])
-            default_start = (datetime.now() + timedelta(minutes=5))
+            # Frozen per session so reruns don't keep moving the widget defaults
+            if "create_task_default_start" not in st.session_state:
+                st.session_state["create_task_default_start"] = datetime.now() + timedelta(minutes=5)
+            default_start = st.session_state["create_task_default_start"]
             start_date = d1.date_input("First reminder date", value=default_start.date())
             start_time = d2.time_input("First reminder time", value=default_start.time())
             remind_for_days = int(d3.number_input("Remind for N days", min_value=1, max_value=60, value=5))
@@ -436,6 +661,7 @@ with tabs[1]:
                         freq_days=freq_days,
                         remind_for_days=remind_for_days
                     )
+                    st.session_state.pop("create_task_default_start", None)
                     st.success(f"Task {t.id} created and scheduled.")
                 except Exception as e:
                     st.error(f"Failed: {e}")
@@ -444,9 +670,14 @@ with tabs[1]:
 with tabs[0]:
     st.header("Tasks Board")
     frow = st.columns([2,2,2,2])
-    status = frow[0].selectbox("Status", ["all","open","in_progress","completed","cancelled"], index=0)
-    assignees = list_contacts()
-    assn_map = {"All": None} | {f"{p.name} ({p.phone_e164})": p.id for p in assignees}
+    counts = task_status_counts()
+    status = frow[0].selectbox(
+        "Status", ["all","open","in_progress","completed","cancelled"], index=0,
+        format_func=lambda x: f"{x} ({sum(counts.values()) if x == 'all' else counts.get(x, 0)})",
+        key="board_status",  # stable identity; otherwise changing counts reset the pick
+    )
+    assignees = _cached_contacts_lite()
+    assn_map = {"All": None} | {f"{name} ({e164})": cid for cid, name, e164 in assignees}
     assignee_pick = frow[1].selectbox("Assignee", list(assn_map.keys()), index=0)
     search = frow[2].text_input("Search title/description")
     if frow[3].button("Refresh", key="refresh_tasks"):
@@ -460,11 +691,13 @@ with tabs[0]:
         st.info("No tasks found.")
     else:
         for t in tasks:
+            due_s = t.due_at.astimezone(TZINFO).strftime(DT_FMT) if t.due_at else "-"
+            start_s = t.start_at.astimezone(TZINFO).strftime(DT_FMT)
             with st.expander(f"#{t.id} • {t.title} • {t.priority.upper()} • {t.status} • Assignee: {t.assignee.name}"):
                 ctop = st.columns([3,2,2,2,2])
                 ctop[0].markdown(f"**Description:** {t.description or '-'}")
-                ctop[1].markdown(f"**Due:** {t.due_at.astimezone(tz.gettz(LOCAL_TZ)).strftime('%d-%b-%Y %I:%M %p') if t.due_at else '-'}")
-                ctop[2].markdown(f"**Start:** {t.start_at.astimezone(tz.gettz(LOCAL_TZ)).strftime('%d-%b-%Y %I:%M %p')}")
+                ctop[1].markdown(f"**Due:** {due_s}")
+                ctop[2].markdown(f"**Start:** {start_s}")
                 ctop[3].markdown(f"**Freq:** every {t.freq_days} day(s)")
                 ctop[4].markdown(f"**Window:** {t.remind_for_days} days")
 
@@ -518,19 +751,21 @@ with tabs[0]:
 # Jobs
 with tabs[3]:
     st.header("Scheduled Jobs")
-    jobs = scheduler.get_jobs()
-    if not jobs:
+    job_rows = _job_rows()
+    if not job_rows:
         st.info("No jobs scheduled.")
     else:
-        dfj = pd.DataFrame([{
-            "id": j.id, "next_run_time": j.next_run_time, "trigger": str(j.trigger), "args": str(j.args)
-        } for j in jobs])
+        dfj = pd.DataFrame({
+            "id": [jid for jid, _ in job_rows],
+            "next_run_time": [datetime.fromtimestamp(ts, TZINFO) if ts is not None else None for _, ts in job_rows],
+        })
         st.dataframe(dfj, use_container_width=True, hide_index=True)
         with st.form("cancel-job"):
             jid = st.text_input("Job ID to cancel")
             if st.form_submit_button("Cancel"):
                 try:
                     scheduler.remove_job(jid)
+                    _job_rows.clear()
                     st.success("Cancelled.")
                 except Exception as e:
                     st.error(f"Failed: {e}")
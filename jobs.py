@@ -0,0 +1,24 @@
+"""Stable import path for APScheduler job functions.
+
+Streamlit executes app.py as a fresh ``__main__`` on every rerun, so jobs that
+reference functions defined there can't be resolved reliably after a restart.
+Jobs point at ``jobs:send_task_ping`` instead, and app.py registers the real
+sender on each run.
+"""
+import threading
+
+_sender = None
+_ready = threading.Event()
+
+def register_sender(fn):
+    """Called by app.py with its current reminder sender."""
+    global _sender
+    _sender = fn
+    _ready.set()
+
+def send_task_ping(task_id: int) -> tuple[bool, str]:
+    # Misfired jobs can run as soon as the scheduler starts, before app.py
+    # has finished loading; give it a moment to register.
+    if not _ready.wait(timeout=30):
+        return False, "Reminder sender not registered"
+    return _sender(task_id)